@@ -6,11 +6,12 @@ from __future__ import annotations
 import argparse
 import json
 import sqlite3
-from dataclasses import asdict, dataclass, field
+import weakref
+from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Mapping, Optional, Sequence
 
 # ── ANSI Colors ───────────────────────────────────────────────────────────────
 GREEN  = "\033[0;32m"
@@ -38,7 +39,74 @@ class Status(str, Enum):
     CANCELLED   = "cancelled"
 
 
-@dataclass
+# On-disk priority is an ordinal so the listing ORDER BY can walk idx_list_order; 0 sorts first.
+_PRIORITY_RANK = {Priority.URGENT: 0, Priority.HIGH: 1, Priority.MEDIUM: 2, Priority.LOW: 3}
+_PRIORITY_BY_RANK = {rank: p for p, rank in _PRIORITY_RANK.items()}
+# Plain dict lookups for trusted values read back from the database; skips Enum.__call__.
+_STATUS_BY_VALUE = {s.value: s for s in Status}
+
+TASK_COLUMNS = ("id", "title", "description", "priority", "status", "deadline",
+                "tags", "notes", "created_at", "updated_at")
+
+_TASKS_DDL = """
+    CREATE TABLE IF NOT EXISTS {name} (
+        id          INTEGER PRIMARY KEY AUTOINCREMENT,
+        title       TEXT    NOT NULL,
+        description TEXT    DEFAULT '',
+        priority    INTEGER NOT NULL DEFAULT 2 CHECK (priority IN (0,1,2,3)),
+        status      TEXT    DEFAULT 'pending',
+        deadline    TEXT,
+        tags        TEXT    DEFAULT '',
+        notes       TEXT    DEFAULT '',
+        created_at  TEXT    NOT NULL,
+        updated_at  TEXT    NOT NULL
+    )
+"""
+
+_INSERT_SQL = ("INSERT INTO tasks (title,description,priority,status,deadline,tags,notes,created_at,updated_at)"
+               " VALUES (?,?,?,?,?,?,?,?,?)")
+_UPDATE_STATUS_SQL = "UPDATE tasks SET status=?,updated_at=? WHERE id=?"
+_DELETE_SQL = "DELETE FROM tasks WHERE id=?"
+_LIST_BASE_SQL = "SELECT {columns} FROM tasks WHERE 1=1"
+
+# Builds the whole export document in SQLite. Tags become a JSON array by quoting the
+# tab-joined text and splitting on the escaped tab; escaped backslashes are parked on
+# char(1), which json_quote never emits raw, so a literal backslash-t in a tag survives.
+# The ordered subquery fixes the aggregation order, so records come out in id order.
+_EXPORT_SQL = r"""
+    SELECT COUNT(*), json_group_array(json_object(
+        'id', id, 'title', title, 'description', description,
+        'priority', CASE priority {priority_cases} END,
+        'status', status, 'deadline', deadline,
+        'tags', CASE WHEN tags IS NULL OR tags = '' THEN json('[]') ELSE json('[' || replace(replace(replace(
+                    json_quote(tags), '\\', char(1)), '\t', '","'), char(1), '\\') || ']') END,
+        'notes', notes, 'created_at', created_at, 'updated_at', updated_at))
+    FROM (SELECT * FROM tasks ORDER BY id)
+""".format(priority_cases=" ".join(f"WHEN {rank} THEN '{p.value}'" for p, rank in _PRIORITY_RANK.items()))
+
+_PRI_COLOR: dict[Priority, str] = {Priority.URGENT: RED, Priority.HIGH: YELLOW,
+                                   Priority.MEDIUM: CYAN, Priority.LOW: GREEN}
+_STA_COLOR: dict[Status, str] = {Status.DONE: GREEN, Status.CANCELLED: RED,
+                                 Status.IN_PROGRESS: YELLOW, Status.PENDING: CYAN}
+
+
+def _join_tags(tags: Iterable[str]) -> str:
+    # Tags are short flat strings; a tab-joined column is cheaper to decode than JSON.
+    return "\t".join(tag.replace("\t", " ") for tag in tags)
+
+
+def _split_tags(raw: Optional[str]) -> List[str]:
+    return raw.split("\t") if raw else []
+
+
+def _is_overdue(deadline: Optional[str], status: Status, today: str) -> bool:
+    # ISO-8601 dates order lexicographically, so a string compare against the caller's
+    # date.today().isoformat() avoids parsing; loops compute `today` once per pass.
+    return (bool(deadline) and status not in (Status.DONE, Status.CANCELLED)
+            and len(deadline) == 10 and deadline < today)
+
+
+@dataclass(slots=True)
 class Task:
     """Represents a single trackable task."""
 
@@ -49,72 +117,176 @@ class Task:
     deadline:    Optional[str] = None
     tags:        List[str]     = field(default_factory=list)
     notes:       str           = ""
-    created_at:  str           = field(default_factory=lambda: datetime.now().isoformat())
-    updated_at:  str           = field(default_factory=lambda: datetime.now().isoformat())
+    created_at:  str           = ""
+    updated_at:  str           = ""
     id:          Optional[int] = None
 
     def is_overdue(self) -> bool:
         """Return True if deadline has passed and task is still open."""
-        if not self.deadline or self.status in (Status.DONE, Status.CANCELLED):
-            return False
-        try:
-            return date.fromisoformat(self.deadline) < date.today()
-        except ValueError:
-            return False
+        return _is_overdue(self.deadline, self.status, date.today().isoformat())
 
     def priority_color(self) -> str:
-        return {Priority.URGENT: RED, Priority.HIGH: YELLOW,
-                Priority.MEDIUM: CYAN, Priority.LOW: GREEN}.get(self.priority, NC)
+        return _PRI_COLOR.get(self.priority, NC)
 
     def status_color(self) -> str:
-        return {Status.DONE: GREEN, Status.CANCELLED: RED,
-                Status.IN_PROGRESS: YELLOW, Status.PENDING: CYAN}.get(self.status, NC)
+        return _STA_COLOR.get(self.status, NC)
+
+
+def _shutdown(conn: sqlite3.Connection) -> None:
+    conn.execute("PRAGMA optimize")
+    conn.close()
 
 
 class TaskManager:
-    """SQLite-backed task management engine."""
+    """SQLite-backed task management engine.
+
+    A manager holds one SQLite connection, so it must be used from the thread that
+    created it. Call close() or use it as a context manager when done; a manager left
+    open is closed when garbage-collected or at interpreter exit.
+    """
 
     def __init__(self, db_path: Path = DB_PATH) -> None:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # One long-lived connection per manager; `with conn:` scopes transactions only.
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.row_factory = sqlite3.Row
         self._init_db()
+        self._conn.execute("PRAGMA optimize")
+        # Holds the connection, not the manager, so an unclosed manager can still be collected.
+        self._finalizer = weakref.finalize(self, _shutdown, self._conn)
+
+    def close(self) -> None:
+        """Refresh planner statistics and release the connection; later calls are no-ops."""
+        self._finalizer()
 
-    def _conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def __enter__(self) -> TaskManager:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _init_db(self) -> None:
-        with self._conn() as conn:
+        conn = self._conn
+        # WAL + relaxed sync: one fsync per checkpoint instead of per write.
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA busy_timeout=5000")
+        conn.execute("PRAGMA mmap_size=134217728")
+        with conn:
+            conn.execute(_TASKS_DDL.format(name="tasks"))
+            if self._column_type(conn, "priority") == "TEXT":
+                self._migrate_priority_rank(conn)
+            if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+                self._migrate_json_tags(conn)
+                conn.execute("PRAGMA user_version=1")
+            # Superseded by the indexes below; the only deadline filter is the open-task
+            # overdue count, which idx_open_deadline serves.
+            for stale in ("idx_status", "idx_priority", "idx_deadline", "idx_prio_dl", "idx_status_prio_dl"):
+                conn.execute(f"DROP INDEX IF EXISTS {stale}")
+            # Mirrors list_tasks_rows' ORDER BY term for term, so listings need no sort step.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_list_order"
+                         " ON tasks(priority, deadline IS NULL, deadline, created_at)")
+            # Same order with a status prefix: filtered listings search it and skip the sort.
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_status_list_order"
+                         " ON tasks(status, priority, deadline IS NULL, deadline, created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_open_deadline ON tasks(deadline)"
+                         " WHERE status NOT IN ('done','cancelled')")
+            has_fts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='tasks_fts'").fetchone()
+            conn.execute("CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+                         "title, description, content='tasks', content_rowid='id')")
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+                    INSERT INTO tasks_fts(rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END
+            """)
             conn.execute("""
-                CREATE TABLE IF NOT EXISTS tasks (
-                    id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title       TEXT    NOT NULL,
-                    description TEXT    DEFAULT '',
-                    priority    TEXT    DEFAULT 'medium',
-                    status      TEXT    DEFAULT 'pending',
-                    deadline    TEXT,
-                    tags        TEXT    DEFAULT '[]',
-                    notes       TEXT    DEFAULT '',
-                    created_at  TEXT    NOT NULL,
-                    updated_at  TEXT    NOT NULL
-                )
+                CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+                    INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                END
             """)
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_status   ON tasks(status)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_priority ON tasks(priority)")
-            conn.execute("CREATE INDEX IF NOT EXISTS idx_deadline ON tasks(deadline)")
-            conn.commit()
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description ON tasks BEGIN
+                    INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+                    VALUES ('delete', old.id, old.title, old.description);
+                    INSERT INTO tasks_fts(rowid, title, description)
+                    VALUES (new.id, new.title, new.description);
+                END
+            """)
+            if not has_fts:
+                # Index rows written before full-text search existed.
+                conn.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+    @staticmethod
+    def _column_type(conn: sqlite3.Connection, column: str) -> str:
+        for col in conn.execute("PRAGMA table_info(tasks)"):
+            if col["name"] == column:
+                return col["type"]
+        return ""
+
+    @staticmethod
+    def _migrate_priority_rank(conn: sqlite3.Connection) -> None:
+        """Rebuild a legacy table whose priority column holds enum names."""
+        # One self-contained script transaction; the AUTOINCREMENT high-water mark is
+        # carried over so ids of deleted tasks are not handed out again.
+        conn.executescript(f"""
+            BEGIN;
+            {_TASKS_DDL.format(name="tasks_new")};
+            INSERT INTO tasks_new
+            SELECT id, title, description,
+                   CASE priority WHEN 'urgent' THEN 0 WHEN 'high' THEN 1 WHEN 'low' THEN 3 ELSE 2 END,
+                   status, deadline, tags, notes, created_at, updated_at
+            FROM tasks;
+            DELETE FROM sqlite_sequence WHERE name = 'tasks_new';
+            INSERT INTO sqlite_sequence (name, seq)
+            SELECT 'tasks_new', seq FROM sqlite_sequence WHERE name = 'tasks';
+            DROP TABLE tasks;
+            ALTER TABLE tasks_new RENAME TO tasks;
+            COMMIT;
+        """)
+
+    @staticmethod
+    def _migrate_json_tags(conn: sqlite3.Connection) -> None:
+        """Rewrite tags stored as JSON arrays into the tab-joined form."""
+        updates = []
+        for row in conn.execute("SELECT id, tags FROM tasks WHERE tags LIKE '[%]'"):
+            try:
+                tags = json.loads(row["tags"])
+            except ValueError:
+                continue
+            if isinstance(tags, list):
+                updates.append((_join_tags(str(t) for t in tags), row["id"]))
+        conn.executemany("UPDATE tasks SET tags=? WHERE id=?", updates)
 
     def _row_to_task(self, row: sqlite3.Row) -> Task:
         return Task(
             id=row["id"], title=row["title"],
             description=row["description"] or "",
-            priority=Priority(row["priority"]), status=Status(row["status"]),
-            deadline=row["deadline"], tags=json.loads(row["tags"] or "[]"),
+            priority=_PRIORITY_BY_RANK[row["priority"]], status=_STATUS_BY_VALUE[row["status"]],
+            deadline=row["deadline"], tags=_split_tags(row["tags"]),
             notes=row["notes"] or "", created_at=row["created_at"],
             updated_at=row["updated_at"],
         )
 
+    def _row_to_task_lite(self, row: sqlite3.Row) -> Task:
+        """Like _row_to_task, but only decodes the columns the query selected."""
+        fields = {k: row[k] for k in row.keys()}
+        if "priority" in fields:
+            fields["priority"] = _PRIORITY_BY_RANK[fields["priority"]]
+        if "status" in fields:
+            fields["status"] = _STATUS_BY_VALUE[fields["status"]]
+        if "tags" in fields:
+            fields["tags"] = _split_tags(fields["tags"])
+        for key in ("description", "notes"):
+            if key in fields:
+                fields[key] = fields[key] or ""
+        return Task(**fields)
+
     def add(self, title: str, description: str = "", priority: str = "medium",
             deadline: Optional[str] = None, tags: Optional[List[str]] = None,
             notes: str = "") -> Task:
@@ -123,101 +295,140 @@ class TaskManager:
         task = Task(title=title, description=description, priority=Priority(priority),
                     deadline=deadline, tags=tags or [], notes=notes,
                     created_at=now, updated_at=now)
-        with self._conn() as conn:
-            cur = conn.execute(
-                "INSERT INTO tasks (title,description,priority,status,deadline,tags,notes,created_at,updated_at)"
-                " VALUES (?,?,?,?,?,?,?,?,?)",
-                (task.title, task.description, task.priority.value, task.status.value,
-                 task.deadline, json.dumps(task.tags), task.notes, task.created_at, task.updated_at),
-            )
-            conn.commit()
-            task.id = cur.lastrowid
+        [task.id] = self.add_many([{
+            "title": task.title, "description": task.description, "priority": task.priority,
+            "deadline": task.deadline, "tags": task.tags, "notes": task.notes,
+            "created_at": task.created_at, "updated_at": task.updated_at,
+        }])
         return task
 
+    def add_many(self, tasks: List[dict]) -> List[int]:
+        """Persist several tasks in a single transaction; returns their ids in order."""
+        now = datetime.now().isoformat()
+        rows = [
+            (t["title"], t.get("description", ""), _PRIORITY_RANK[Priority(t.get("priority", "medium"))],
+             Status(t.get("status", "pending")).value, t.get("deadline"), _join_tags(t.get("tags") or []),
+             t.get("notes", ""), t.get("created_at", now), t.get("updated_at", now))
+            for t in tasks
+        ]
+        if not rows:
+            return []
+        conn = self._conn
+        with conn:
+            cur = conn.cursor()
+            cur.executemany(_INSERT_SQL, rows)
+            # Ids are contiguous: the batch is one write transaction on one connection.
+            last = cur.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last - len(rows) + 1, last + 1))
+
     def list_tasks(self, status: Optional[str] = None, priority: Optional[str] = None,
-                   search: Optional[str] = None) -> List[Task]:
-        """Query tasks with optional filters; sorted by priority then deadline."""
-        sql = "SELECT * FROM tasks WHERE 1=1"
+                   search: Optional[str] = None,
+                   columns: Sequence[str] = TASK_COLUMNS) -> List[Task]:
+        """Query tasks with optional filters; sorted by priority then deadline.
+
+        ``search`` is a full-text, word-prefix match on title and description.
+
+        Fields left out of ``columns`` are not read and keep their Task defaults;
+        ``title`` has no default, so it must be selected.
+        """
+        if "title" not in columns:
+            raise ValueError("task columns must include: title")
+        to_task = self._row_to_task if tuple(columns) == TASK_COLUMNS else self._row_to_task_lite
+        return [to_task(r) for r in self.list_tasks_rows(status, priority, search, columns)]
+
+    def list_tasks_rows(self, status: Optional[str] = None, priority: Optional[str] = None,
+                        search: Optional[str] = None,
+                        columns: Sequence[str] = TASK_COLUMNS) -> Iterator[sqlite3.Row]:
+        """Like list_tasks, but returns the live cursor over raw rows (priority as its integer rank).
+
+        Arguments are validated when called; rows are fetched as the cursor is iterated.
+        """
+        unknown = set(columns) - set(TASK_COLUMNS)
+        if unknown:
+            raise ValueError(f"unknown task columns: {', '.join(sorted(unknown))}")
+        sql = _LIST_BASE_SQL.format(columns=",".join(columns))
         params: list = []
         if status:
             sql += " AND status=?"; params.append(status)
         if priority:
-            sql += " AND priority=?"; params.append(priority)
+            sql += " AND priority=?"; params.append(_PRIORITY_RANK.get(priority))
         if search:
-            sql += " AND (title LIKE ? OR description LIKE ?)"; params += [f"%{search}%"] * 2
-        sql += (" ORDER BY CASE priority WHEN 'urgent' THEN 1 WHEN 'high' THEN 2"
-                " WHEN 'medium' THEN 3 ELSE 4 END, deadline NULLS LAST, created_at")
-        with self._conn() as conn:
-            rows = conn.execute(sql, params).fetchall()
-        return [self._row_to_task(r) for r in rows]
+            # Quoted phrase, word-prefix match: "doc" finds "docs", but "oc" does not.
+            sql += " AND id IN (SELECT rowid FROM tasks_fts WHERE tasks_fts MATCH ?)"
+            params.append('"' + search.replace('"', '""') + '"*')
+        sql += " ORDER BY priority ASC, deadline IS NULL, deadline, created_at"
+        return self._conn.execute(sql, params)
 
     def update_status(self, task_id: int, new_status: str) -> bool:
         """Update a task's status by id; returns False if not found."""
-        with self._conn() as conn:
-            cur = conn.execute("UPDATE tasks SET status=?,updated_at=? WHERE id=?",
-                               (new_status, datetime.now().isoformat(), task_id))
-            conn.commit()
+        conn = self._conn
+        with conn:
+            cur = conn.execute(_UPDATE_STATUS_SQL, (new_status, datetime.now().isoformat(), task_id))
         return cur.rowcount > 0
 
     def delete(self, task_id: int) -> bool:
         """Hard-delete a task record; returns False if not found."""
-        with self._conn() as conn:
-            cur = conn.execute("DELETE FROM tasks WHERE id=?", (task_id,))
-            conn.commit()
+        conn = self._conn
+        with conn:
+            cur = conn.execute(_DELETE_SQL, (task_id,))
         return cur.rowcount > 0
 
     def export_json(self, path: str) -> int:
         """Dump all tasks as JSON; returns count written."""
-        tasks = self.list_tasks()
-        records = []
-        for t in tasks:
-            d = asdict(t)
-            d["priority"] = t.priority.value
-            d["status"]   = t.status.value
-            records.append(d)
+        count, document = self._conn.execute(_EXPORT_SQL).fetchone()
         with open(path, "w") as fh:
-            json.dump(records, fh, indent=2, default=str)
-        return len(records)
+            fh.write(document)
+        return count
 
     def stats(self) -> dict:
         """Return aggregate counters across all tasks."""
-        tasks = self.list_tasks()
-        by_status: dict = {}
-        by_priority: dict = {}
-        overdue = 0
-        for t in tasks:
-            by_status[t.status.value]     = by_status.get(t.status.value, 0) + 1
-            by_priority[t.priority.value] = by_priority.get(t.priority.value, 0) + 1
-            if t.is_overdue():
-                overdue += 1
-        return {"total": len(tasks), "by_status": by_status,
+        cur = self._conn.cursor()
+        total = cur.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+        by_status = dict(cur.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+        by_priority = {_PRIORITY_BY_RANK[rank].value: count for rank, count in
+                       cur.execute("SELECT priority, COUNT(*) FROM tasks GROUP BY priority").fetchall()}
+        overdue = cur.execute(
+            "SELECT COUNT(*) FROM tasks WHERE deadline IS NOT NULL AND deadline < :today"
+            " AND length(deadline) = 10 AND status NOT IN ('done','cancelled')",
+            {"today": date.today().isoformat()},
+        ).fetchone()[0]
+        return {"total": total, "by_status": by_status,
                 "by_priority": by_priority, "overdue": overdue}
 
 
 # ── CLI ───────────────────────────────────────────────────────────────────────
 
-def _print_task(t: Task) -> None:
-    pc = t.priority_color()
-    sc = t.status_color()
-    ov = f" {RED}[OVERDUE]{NC}" if t.is_overdue() else ""
-    dl = f"  due:{YELLOW}{t.deadline}{NC}" if t.deadline else ""
-    tg = f"  [{', '.join(t.tags)}]" if t.tags else ""
-    print(f"  {BOLD}#{t.id:<4}{NC} {pc}{t.priority.value:<8}{NC} {sc}{t.status.value:<13}{NC}"
-          f" {t.title}{ov}{dl}{tg}")
-    if t.description:
-        print(f"            {t.description[:100]}")
+_LIST_COLUMNS = ("id", "title", "description", "priority", "status", "deadline", "tags")
+
+
+def _print_task(row: Mapping, today: str) -> None:
+    """Print one listing line from a row (see list_tasks_rows) without building a Task."""
+    priority = _PRIORITY_BY_RANK[row["priority"]]
+    status   = _STATUS_BY_VALUE[row["status"]]
+    deadline = row["deadline"]
+    tags     = _split_tags(row["tags"])
+    pc = _PRI_COLOR.get(priority, NC)
+    sc = _STA_COLOR.get(status, NC)
+    ov = f" {RED}[OVERDUE]{NC}" if _is_overdue(deadline, status, today) else ""
+    dl = f"  due:{YELLOW}{deadline}{NC}" if deadline else ""
+    tg = f"  [{', '.join(tags)}]" if tags else ""
+    print(f"  {BOLD}#{row['id']:<4}{NC} {pc}{priority.value:<8}{NC} {sc}{status.value:<13}{NC}"
+          f" {row['title']}{ov}{dl}{tg}")
+    if row["description"]:
+        print(f"            {row['description'][:100]}")
 
 
 def cmd_list(args: argparse.Namespace, mgr: TaskManager) -> None:
-    tasks = mgr.list_tasks(status=args.filter_status, priority=args.filter_priority,
-                           search=args.search)
-    if not tasks:
+    rows = list(mgr.list_tasks_rows(status=args.filter_status, priority=args.filter_priority,
+                                    search=args.search, columns=_LIST_COLUMNS))
+    if not rows:
         print(f"{YELLOW}No tasks found.{NC}"); return
-    print(f"\n{BOLD}{BLUE}── Tasks ({len(tasks)}) {'─'*40}{NC}")
+    print(f"\n{BOLD}{BLUE}── Tasks ({len(rows)}) {'─'*40}{NC}")
     print(f"  {'#':<5} {'Priority':<9} {'Status':<14} Title")
     print(f"  {'─'*5} {'─'*8} {'─'*13} {'─'*30}")
-    for t in tasks:
-        _print_task(t)
+    today = date.today().isoformat()
+    for row in rows:
+        _print_task(row, today)
     print()
 
 
@@ -267,7 +478,8 @@ def build_parser() -> argparse.ArgumentParser:
     ls = sub.add_parser("list", help="List tasks")
     ls.add_argument("--filter-status",   dest="filter_status",   metavar="STATUS")
     ls.add_argument("--filter-priority", dest="filter_priority", metavar="PRIORITY")
-    ls.add_argument("--search",          metavar="TERM")
+    ls.add_argument("--search",          metavar="TERM",
+                    help="Word-prefix match on title/description")
 
     add = sub.add_parser("add", help="Create a new task")
     add.add_argument("title")
@@ -292,9 +504,9 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> None:
     parser = build_parser()
     args   = parser.parse_args()
-    mgr    = TaskManager()
-    {"list": cmd_list, "add": cmd_add, "status": cmd_status,
-     "update": cmd_update, "export": cmd_export}[args.command](args, mgr)
+    with TaskManager() as mgr:
+        {"list": cmd_list, "add": cmd_add, "status": cmd_status,
+         "update": cmd_update, "export": cmd_export}[args.command](args, mgr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """Return a factory that writes a database in the original text-priority, JSON-tags schema."""
+
+    def build(rows, delete_ids=()):
+        path = tmp_path / "legacy.db"
+        conn = sqlite3.connect(path)
+        conn.execute("""
+            CREATE TABLE tasks (
+                id          INTEGER PRIMARY KEY AUTOINCREMENT,
+                title       TEXT    NOT NULL,
+                description TEXT    DEFAULT '',
+                priority    TEXT    DEFAULT 'medium',
+                status      TEXT    DEFAULT 'pending',
+                deadline    TEXT,
+                tags        TEXT    DEFAULT '[]',
+                notes       TEXT    DEFAULT '',
+                created_at  TEXT    NOT NULL,
+                updated_at  TEXT    NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX idx_status   ON tasks(status)")
+        conn.execute("CREATE INDEX idx_priority ON tasks(priority)")
+        conn.execute("CREATE INDEX idx_deadline ON tasks(deadline)")
+        conn.executemany(
+            "INSERT INTO tasks (title,description,priority,tags,created_at,updated_at) VALUES (?,?,?,?,?,?)",
+            [(r["title"], r.get("description", ""), r.get("priority", "medium"), r.get("tags", "[]"),
+              "2024-01-01T00:00:00", "2024-01-01T00:00:00") for r in rows],
+        )
+        conn.executemany("DELETE FROM tasks WHERE id=?", [(i,) for i in delete_ids])
+        conn.commit()
+        conn.close()
+        return path
+
+    return build
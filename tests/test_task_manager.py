@@ -0,0 +1,80 @@
+import json
+
+from task_manager import Priority, TaskManager
+
+
+def test_priority_migration_rebuilds_legacy_table(legacy_db):
+    path = legacy_db([
+        {"title": "Water plants", "priority": "low"},
+        {"title": "Fix outage", "priority": "urgent", "description": "prod database"},
+        {"title": "Write report", "priority": "medium"},
+        {"title": "Deleted task", "priority": "high"},
+    ], delete_ids=[4])
+
+    with TaskManager(path) as mgr:
+        assert mgr._column_type(mgr._conn, "priority") == "INTEGER"
+        tasks = mgr.list_tasks()
+        assert [(t.id, t.title, t.priority) for t in tasks] == [
+            (2, "Fix outage", Priority.URGENT),
+            (3, "Write report", Priority.MEDIUM),
+            (1, "Water plants", Priority.LOW),
+        ]
+        # The AUTOINCREMENT high-water mark survives the rebuild: id 4 is not reused.
+        assert mgr.add("After migration").id == 5
+        assert [t.title for t in mgr.list_tasks(search="outage")] == ["Fix outage"]
+        assert [t.title for t in mgr.list_tasks(search="datab")] == ["Fix outage"]
+        assert [t.title for t in mgr.list_tasks(search="migration")] == ["After migration"]
+
+    with TaskManager(path) as mgr:
+        assert [t.id for t in mgr.list_tasks()] == [2, 3, 5, 1]
+
+
+def test_json_tags_migration_runs_once(legacy_db):
+    path = legacy_db([
+        {"title": "array", "tags": '["home", "a b", 3]'},
+        {"title": "empty", "tags": "[]"},
+        {"title": "object", "tags": '{"k": "v"}'},
+        {"title": "invalid", "tags": "[not json]"},
+    ])
+
+    with TaskManager(path) as mgr:
+        assert {t.title: t.tags for t in mgr.list_tasks()} == {
+            "array": ["home", "a b", "3"],
+            "empty": [],
+            "object": ['{"k": "v"}'],
+            "invalid": ["[not json]"],
+        }
+        assert mgr._conn.execute("PRAGMA user_version").fetchone()[0] == 1
+        with mgr._conn:
+            mgr._conn.execute("UPDATE tasks SET tags=? WHERE title='empty'", ('["x", "y"]',))
+
+    # A JSON-looking value written after the one-shot conversion is not rewritten again.
+    with TaskManager(path) as mgr:
+        assert {t.title: t.tags for t in mgr.list_tasks()}["empty"] == ['["x", "y"]']
+
+
+def test_export_json_tags_match_stored_tags(tmp_path):
+    tag_sets = [
+        [],
+        ["plain"],
+        ["back\\slash", "trailing\\", "\\\\t", "a\\tb"],
+        ["tab\there", "quo\"te", "new\nline", "ctrl\x01\x1f", "emoji 🚀", "é"],
+        ["", "after empty"],
+    ]
+    with TaskManager(tmp_path / "t.db") as mgr:
+        mgr.add_many([{"title": f"t{i}", "tags": tags} for i, tags in enumerate(tag_sets)])
+        stored = {t.id: t.tags for t in mgr.list_tasks()}
+        out = tmp_path / "export.json"
+        assert mgr.export_json(str(out)) == len(tag_sets)
+
+    records = json.loads(out.read_text())
+    assert [r["id"] for r in records] == sorted(stored)
+    assert {r["id"]: r["tags"] for r in records} == stored
+    assert records[3]["tags"][0] == "tab here"
+
+
+def test_export_json_empty_table(tmp_path):
+    with TaskManager(tmp_path / "t.db") as mgr:
+        out = tmp_path / "export.json"
+        assert mgr.export_json(str(out)) == 0
+    assert json.loads(out.read_text()) == []